@@ -24,14 +24,106 @@ DataFrames.
 
 """
 
+import asyncio
 import functools
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import stamina
 
+import numpy as np
 import pandas as pd
-import janitor  # noqa: F401
 import requests
 from pathlib import Path
+from urllib.parse import quote
+
+from requests.adapters import HTTPAdapter
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from worms_cache import WormsCache
+
+# One session shared by all the WoRMS lookups so TCP/TLS connections are
+# reused instead of re-negotiated per name. Retries are stamina's job.
+SESSION = requests.Session()
+SESSION.mount(
+    "http://", HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0)
+)
+SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0)
+)
+
+WORMS_URL = "http://www.marinespecies.org/rest/AphiaRecordsByName/{name}?like=true&marine_only=true"
+WORMS_BULK_URL = "https://www.marinespecies.org/rest/AphiaRecordsByMatchNames"
+
+# The bulk endpoint accepts up to 50 names per request.
+BULK_BATCH_SIZE = 50
+
+MAX_WORKERS = 16
+
+
+@functools.lru_cache(maxsize=1)
+def _get_cache():
+    """On-disk cache so re-runs skip the WoRMS API for names already seen.
+
+    Created lazily so importing the module performs no filesystem I/O; only
+    the code paths that actually talk to WoRMS touch disk.
+    """
+    return WormsCache()
+
+
+class RateLimiter:
+    """Token-bucket limiter so the threadpool stays polite with WoRMS.
+
+    Throttling requests before they leave avoids 429/retry loops, which
+    waste far more wall time than waiting for a token.
+    """
+
+    def __init__(self, rpm=60):
+        self.rpm = rpm
+        self.request_tokens = float(rpm)
+        self.last_update = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.request_tokens = min(
+                    self.rpm,
+                    self.request_tokens + (now - self.last_update) * self.rpm / 60,
+                )
+                self.last_update = now
+                if self.request_tokens >= 1:
+                    self.request_tokens -= 1
+                    return
+            time.sleep(60 / self.rpm / 10)
+
+
+# Shared by all the worker threads.
+LIMITER = RateLimiter(rpm=60)
 
 required_occurrence_columns = [
     "occurrenceID",
@@ -61,35 +153,196 @@ required_event_columns = [
 ]
 
 
+optional_depth_columns = [
+    "minimumDepthInMeters",
+    "maximumDepthInMeters",
+]
+
+
 required_columns = (
     required_occurrence_columns + required_emof_columns + required_event_columns
 )
 
+# Explicit dtypes so the CSV reader can skip inference on the columns we use.
+# float32 is plenty for degrees of lat/lon and halves the bandwidth of the
+# bounds checks; the dictionary-encoded ID columns hash as small ints in the
+# joins instead of comparing strings.
+CSV_DTYPES = {
+    "decimalLatitude": "float32",
+    "decimalLongitude": "float32",
+    "eventID": "category",
+    "occurrenceID": "category",
+    "scientificName": "category",
+}
+
+
+_SPECIAL_CHARS = re.compile(r"[^0-9A-Za-z_]")
+
+
+def clean_column_names(columns):
+    """Strip whitespace/special characters and trim underscores from headers.
+
+    One vectorized pass over the header, equivalent to the
+    `janitor.clean_names` configuration used before (case preserved, special
+    characters removed, leading/trailing underscores stripped).
+    """
+    return (
+        columns.str.strip().str.replace(_SPECIAL_CHARS, "", regex=True).str.strip("_")
+    )
+
+
+def read_dwc_csv(fname, columns, **kw):
+    """Read a DwC CSV keeping only the columns the checks use.
+
+    Uses the faster pyarrow engine with explicit dtypes when available,
+    falling back to the default engine otherwise. Columns are matched on the
+    raw header so files whose names still need cleaning load the same way.
+    """
+    wanted = set(columns).union(optional_depth_columns).union(CSV_DTYPES)
+    header = pd.read_csv(fname, nrows=0, **kw).columns
+    # Match the sniffed header through the same transform the cleaner uses,
+    # so a column the cleaner would recover is never dropped at read time.
+    usecols = [
+        raw
+        for raw, cleaned in zip(header, clean_column_names(header))
+        if cleaned in wanted
+    ]
+    if not usecols:
+        # Unrecognized headers: load everything and let the checks flag it.
+        usecols = None
+    try:
+        return pd.read_csv(
+            fname, engine="pyarrow", usecols=usecols, dtype=CSV_DTYPES, **kw
+        )
+    except (ImportError, ValueError):
+        pass
+    # memory_map lets the C parser read straight from the mmap'd file
+    # instead of an intermediate buffer; pyarrow does not support it.
+    try:
+        return pd.read_csv(
+            fname, usecols=usecols, dtype=CSV_DTYPES, memory_map=True, **kw
+        )
+    except ValueError:
+        # Non-numeric junk in a float column: that is data the checks must
+        # report, not a reason to crash. Load those columns as-is and let
+        # `to_numeric(errors="coerce")` flag the bad rows.
+        dtypes = {k: v for k, v in CSV_DTYPES.items() if not v.startswith("float")}
+        return pd.read_csv(fname, usecols=usecols, dtype=dtypes, memory_map=True, **kw)
+
+
+def _select_check_columns(df, columns):
+    """Project `df` down to the columns the checks use before joining.
+
+    Shrinking the frames first cuts the bytes hashed and copied during the
+    joins; wide DwC files often carry many columns no check looks at. Frames
+    with none of the expected columns are left alone so the required-columns
+    check can report them.
+    """
+    keep = [c for c in columns if c in df.columns]
+    return df[keep] if keep else df
+
+
+def _missing_keys_msg(left, right, key):
+    """Bounded left-minus-right key diff for the merge failure messages.
+
+    `Index.difference` runs on hashed arrays and only the first few missing
+    keys are formatted, so the failure path no longer materializes every key
+    of both columns as Python strings.
+    """
+    missing = pd.Index(left.unique()).difference(pd.Index(right.unique()))
+    shown = missing[:20].tolist()
+    more = len(missing) - len(shown)
+    suffix = f" (and {more} more)" if more else ""
+    return f"first missing `{key}` values: {shown}{suffix}"
+
+
+def _check_merge_tables_duckdb(df_event, df_occurrence, df_emof):
+    """Fuse both joins into one vectorized DuckDB query.
+
+    DuckDB executes the joins out-of-core without materializing the
+    intermediate event+occurrence frame, which matters for big EMoF files.
+    Key uniqueness is validated with cheap COUNT(DISTINCT ...) scans instead
+    of pandas' `validate=`.
+    """
+    df = None
+    con = duckdb.connect()
+    con.register("ev", df_event)
+    con.register("oc", df_occurrence)
+    con.register("em", df_emof)
+    try:
+        if not con.execute(
+            # COUNT of the column (not *) so NULL keys don't read as dupes;
+            # the inner join drops them, same as the pandas path.
+            'SELECT COUNT("eventID") = COUNT(DISTINCT "eventID") FROM ev'
+        ).fetchone()[0]:
+            return (
+                df,
+                "❌ Merge tables failed. \n`eventID` is not unique in the event table.",
+            )
+        if not con.execute(
+            'SELECT COUNT("occurrenceID") = COUNT(DISTINCT "occurrenceID") FROM oc'
+        ).fetchone()[0]:
+            return (
+                df,
+                "❌ Merge tables failed. \n`occurrenceID` is not unique in the occurrence table.",
+            )
+        df = con.execute(
+            'SELECT * FROM ev JOIN oc USING ("eventID") JOIN em USING ("occurrenceID")'
+        ).df()
+    except duckdb.Error as err:
+        return None, f"❌ Merge tables failed. \n{err}"
+    if df.empty:
+        return df, "❌ Merge tables failed.\nNo matching `eventID`/`occurrenceID` keys."
+    return df, "✅ Merge tables passed!"
+
 
 def check_merge_tables(df_event, df_occurrence, df_emof):
     """Using `one_to_many` to check if merge keys are unique in left dataset."""
+    df_event = _select_check_columns(
+        df_event, required_event_columns + optional_depth_columns
+    )
+    df_occurrence = _select_check_columns(
+        df_occurrence,
+        ["eventID"] + required_occurrence_columns + optional_depth_columns,
+    )
+    df_emof = _select_check_columns(df_emof, required_emof_columns)
+    if duckdb is not None:
+        return _check_merge_tables_duckdb(df_event, df_occurrence, df_emof)
     df = None
-    try:
-        msg = "✅ Merge tables passed!"
-        df_event_occur = df_event.merge(
-            df_occurrence, on="eventID", validate="one_to_many"
+    msg = "✅ Merge tables passed!"
+    # Checking uniqueness up-front is a single hashed pass and lets the joins
+    # skip the extra key-validation table that `validate=` would build.
+    if not df_event["eventID"].is_unique:
+        return (
+            df,
+            "❌ Merge tables failed. \n`eventID` is not unique in the event table.",
         )
-        if df_event_occur.empty:
-            msg = f"❌ Merge tables failed.\nCould not merge {set(df_event['eventID'])}\non\n{set(df_occurrence['eventID'])}."
-            return df, msg
-        df = df_event_occur.merge(
-            df_emof, on="occurrenceID", validate="one_to_many", suffixes=(None, "r_")
+    df_event_occur = df_event.set_index("eventID").join(
+        df_occurrence.set_index("eventID"), how="inner", rsuffix="r_"
+    )
+    if df_event_occur.empty:
+        msg = f"❌ Merge tables failed.\nCould not merge on `eventID`, {_missing_keys_msg(df_event['eventID'], df_occurrence['eventID'], 'eventID')}."
+        return df, msg
+    if not df_event_occur["occurrenceID"].is_unique:
+        return (
+            df,
+            "❌ Merge tables failed. \n`occurrenceID` is not unique in the occurrence table.",
         )
-        if df.empty:
-            msg = f"❌ Merge tables failed.\nCould not merge {set(df_occurrence['occurrenceID'])}\non\n{set(df_emof['occurrenceID'])}."
-            return df, msg
-    except pd.errors.MergeError as err:
-        msg = f"❌ Merge tables failed. \n{err}"
+    df = (
+        df_event_occur.reset_index()
+        .set_index("occurrenceID")
+        .join(df_emof.set_index("occurrenceID"), how="inner", rsuffix="r_")
+        .reset_index()
+    )
+    if df.empty:
+        msg = f"❌ Merge tables failed.\nCould not merge on `occurrenceID`, {_missing_keys_msg(df_occurrence['occurrenceID'], df_emof['occurrenceID'], 'occurrenceID')}."
+        return df, msg
     return df, msg
 
 
 def check_required_columns(df, columns):
-    missing_cols = list(set(columns).difference(df.columns))
+    # `pd.Index.difference` runs on hashed arrays, no Python set boxing.
+    missing_cols = pd.Index(columns).difference(df.columns).tolist()
     res = True
     msg = "✅ Passed required columns!"
     if missing_cols:
@@ -99,7 +352,7 @@ def check_required_columns(df, columns):
 
 
 def check_null_values(df, columns):
-    missing = df.columns[df.isna().any()].to_list()
+    missing = sorted(df.columns[df.isna().any().to_numpy()])
     res = True
     msg = "✅ Passed null values check!"
     if missing:
@@ -108,18 +361,57 @@ def check_null_values(df, columns):
     return res, msg
 
 
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _bounds_mask(values, lo, hi, bad):
+        # v != v is the branch-free NaN test; one pass, no temporaries.
+        for i in numba.prange(values.size):
+            v = values[i]
+            bad[i] = v != v or v <= lo or v >= hi
+
+
+def _invalid_bounds(series, lo, hi):
+    """Row positions where `series` is non-numeric or outside (lo, hi).
+
+    Works on a single float array so the whole check is three vectorized
+    ufuncs instead of a chain of intermediate pandas Series. Columns already
+    stored as float32 are scanned without a copy or an upcast. With numba
+    installed the NaN and range tests fuse into one parallel pass with no
+    intermediate masks at all.
+    """
+    values = pd.to_numeric(series, errors="coerce").to_numpy()
+    if numba is not None and values.dtype.kind == "f":
+        bad = np.empty(values.size, np.bool_)
+        _bounds_mask(values, lo, hi, bad)
+        return np.flatnonzero(bad)
+    return np.flatnonzero(np.isnan(values) | (values <= lo) | (values >= hi))
+
+
+def _runs(idx):
+    """Format row indices compactly, collapsing consecutive runs.
+
+    e.g. [12, 13, 14, 99, 200, 201] becomes "[12-14, 99, 200-201]", keeping
+    the reports short even when thousands of contiguous rows are bad.
+    """
+    if idx.size == 0:
+        return "[]"
+    breaks = np.flatnonzero(np.diff(idx) != 1) + 1
+    parts = [
+        str(run[0]) if run.size == 1 else f"{run[0]}-{run[-1]}"
+        for run in np.split(idx, breaks)
+    ]
+    return f"[{', '.join(parts)}]"
+
+
 def check_latitude(df):
     res = True
     msg = "✅ Passed `decimalLatitude` bounds!"
     if "decimalLatitude" not in df.columns:
         return False, "⚠️  Cannot find `decimalLatitude` column."
-    invalid_lat = df[
-        pd.to_numeric(df["decimalLatitude"], errors="coerce").isna()
-        | (df["decimalLatitude"] <= -90)
-        | (df["decimalLatitude"] >= 90)
-    ]
-    if not invalid_lat.empty:
-        msg = f"❌ Invalid `decimalLatitude` values detected. {invalid_lat.index.tolist()}"
+    bad = df.index.to_numpy()[_invalid_bounds(df["decimalLatitude"], -90, 90)]
+    if bad.size:
+        msg = f"❌ Invalid `decimalLatitude` values detected. {_runs(bad)}"
         res = False
     return res, msg
 
@@ -129,13 +421,9 @@ def check_longitude(df):
     msg = "✅ Passed `decimalLongitude` bounds!"
     if "decimalLongitude" not in df.columns:
         return False, "⚠️  Cannot find `decimalLongitude` column."
-    invalid_lon = df[
-        pd.to_numeric(df["decimalLongitude"], errors="coerce").isna()
-        | (df["decimalLongitude"] <= -180)
-        | (df["decimalLongitude"] >= 180)
-    ]
-    if not invalid_lon.empty:
-        msg = f" Invalid decimalLongitude values detected. {invalid_lon.index.tolist()}"
+    bad = df.index.to_numpy()[_invalid_bounds(df["decimalLongitude"], -180, 180)]
+    if bad.size:
+        msg = f"❌ Invalid `decimalLongitude` values detected. {_runs(bad)}"
         res = False
     return res, msg
 
@@ -143,36 +431,37 @@ def check_longitude(df):
 def check_depth_consistency(df):
     res = True
     msg = "✅ Passed depth consistency test!"
-    if ("minimumDepthInMeters", "maximumDepthInMeters") not in df.columns:
+    cols = {"minimumDepthInMeters", "maximumDepthInMeters"}
+    if not cols.issubset(df.columns):
         msg = (
             "⚠️  No depth information found (minimumDepthInMeters/maximumDepthInMeters)."
         )
         # We return here b/c we cannot run the tests below without these columns.
         return False, msg
 
-    min_depth = pd.to_numeric(df["minimumDepthInMeters"], errors="coerce")
-    msg_min = ""
-    if not min_depth.isna().empty:
-        msg_min = (
-            f"⚠️  Non-numeric values in minimumDepthInMeters {min_depth.index.tolist()}"
-        )
-        res = False
+    min_depth = pd.to_numeric(df["minimumDepthInMeters"], errors="coerce").to_numpy(
+        dtype="float64"
+    )
+    max_depth = pd.to_numeric(df["maximumDepthInMeters"], errors="coerce").to_numpy(
+        dtype="float64"
+    )
+    index = df.index.to_numpy()
 
-    max_depth = pd.to_numeric(df["minimumDepthInMeters"], errors="coerce")
-    msg_max = ""
-    if not max_depth.isna().empty:
-        msg_max = (
-            f"⚠️  Non-numeric values in minimumDepthInMeters {max_depth.index.tolist()}"
-        )
+    msgs = []
+    bad_nan = np.flatnonzero(np.isnan(min_depth) | np.isnan(max_depth))
+    if bad_nan.size:
+        msgs.append(f"⚠️  Non-numeric or missing depth values {_runs(index[bad_nan])}")
         res = False
 
     # Check logic: Min should not be greater than Max
-    illogical = all(min_depth >= max_depth)
-
-    if not illogical.empty:
-        msg = f"❌ minimumDepthInMeters is greater than maximumDepthInMeters {illogical.tolist()}"
+    illogical = np.flatnonzero(min_depth > max_depth)
+    if illogical.size:
+        msgs.append(
+            f"❌ minimumDepthInMeters is greater than maximumDepthInMeters {_runs(index[illogical])}"
+        )
         res = False
-    msg = f"{msg_min}\n{msg_max}\n{msg}"
+    if msgs:
+        msg = "\n".join(msgs)
     return res, msg
 
 
@@ -180,24 +469,114 @@ def check_scientific_names(df):
     if "scientificName" not in df.columns:
         return [None, "⚠️  Missing the `scientificName` column!"]
 
-    names = list(set(df["scientificName"]))
+    names = df["scientificName"].dropna().unique().tolist()
 
-    results = [check_scientific_name(name) for name in names]
+    results = _resolve_names(names)
     return [msg for res, msg in results if not res]
 
 
+def _resolve_names(names):
+    """Resolve names against WoRMS, amortizing RTT over bulk requests.
+
+    Cached names are answered locally; the misses go out in batches of
+    `BULK_BATCH_SIZE` over the threadpool, with a per-name fallback for
+    batches the bulk endpoint cannot handle.
+    """
+    cache = _get_cache()
+    results = {}
+    misses = []
+    for name in names:
+        cached = cache.get(name)
+        if cached is not None:
+            results[name] = _evaluate_response(name, *cached)
+        else:
+            misses.append(name)
+
+    batches = [
+        misses[i : i + BULK_BATCH_SIZE] for i in range(0, len(misses), BULK_BATCH_SIZE)
+    ]
+    # The lookups are network-bound: overlap the batches on one event loop
+    # when httpx is installed, otherwise fan them out over a threadpool.
+    if httpx is not None and batches:
+        matched = asyncio.run(_match_batches_async(batches))
+    else:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            matched = list(executor.map(_match_names_bulk, batches))
+    for batch, matches in zip(batches, matched):
+        if matches is None:
+            # Bulk lookup failed for this batch: fall back to one
+            # request per name.
+            for name in batch:
+                results[name] = check_scientific_name(name)
+            continue
+        for name, records in zip(batch, matches):
+            status_code = 200 if records else 204
+            payload = json.dumps(records).encode()
+            cache.set(name, status_code, payload)
+            results[name] = _evaluate_response(name, status_code, payload)
+    return [results[name] for name in names]
+
+
+async def _match_batches_async(batches):
+    """Fetch all the bulk batches concurrently on a single event loop.
+
+    One async client multiplexes every outstanding batch (HTTP/2 when the h2
+    extra is installed) with no per-request thread, sharing the same token
+    bucket as the sync path. A batch that errors comes back as None so the
+    caller falls back to the retried per-name lookup.
+    """
+    semaphore = asyncio.Semaphore(MAX_WORKERS)
+
+    async def one(client, batch):
+        async with semaphore:
+            # The limiter sleeps, so park it on a worker thread.
+            await asyncio.to_thread(LIMITER.acquire)
+            params = [("scientificnames[]", name) for name in batch]
+            params.append(("marine_only", "true"))
+            try:
+                response = await client.get(WORMS_BULK_URL, params=params)
+            except httpx.HTTPError:
+                return None
+            if response.status_code == 204:
+                return [[] for _ in batch]
+            if response.status_code != 200:
+                return None
+            matches = response.json()
+            if len(matches) != len(batch):
+                return None
+            return matches
+
+    limits = httpx.Limits(max_connections=50)
+    try:
+        client = httpx.AsyncClient(http2=True, limits=limits, timeout=60)
+    except ImportError:
+        # No h2 extra; HTTP/1.1 keep-alive still reuses the connections.
+        client = httpx.AsyncClient(limits=limits, timeout=60)
+    async with client:
+        return await asyncio.gather(*(one(client, batch) for batch in batches))
+
+
 @functools.lru_cache(maxsize=128)
 def check_scientific_name(name):
+    cache = _get_cache()
+    cached = cache.get(name)
+    if cached is not None:
+        return _evaluate_response(name, *cached)
+
     response = _check_scientific_name(name)
+    cache.set(name, response.status_code, response.content)
+    return _evaluate_response(name, response.status_code, response.content)
+
 
+def _evaluate_response(name, status_code, payload):
     # Bail early to avoid unnecessary retries.
-    if response.status_code == 204 or response.status_code == 400:
-        return False, f"⚠️  {response.status_code=} for {name=}."
+    if status_code == 204 or status_code == 400:
+        return False, f"⚠️  {status_code=} for {name=}."
 
-    if response.status_code == 200:
-        results = response.json()
+    if status_code == 200:
+        results = json.loads(payload)
     else:
-        msg = f"⚠️  WoRMS API Error: {response.status_code} for {name=}"
+        msg = f"⚠️  WoRMS API Error: {status_code} for {name=}"
         return False, msg
 
     # The API returns a list of lists (one list per name queried).
@@ -213,35 +592,202 @@ def check_scientific_name(name):
     return True, f"{is_unique}."
 
 
+@stamina.retry(on=requests.exceptions.HTTPError, attempts=3)
+def _match_names_bulk(names):
+    """Query up to `BULK_BATCH_SIZE` names in one AphiaRecordsByMatchNames call.
+
+    Returns one record-list per queried name, or None when the endpoint
+    errors so the caller can fall back to per-name lookups.
+    """
+    LIMITER.acquire()
+    params = [("scientificnames[]", name) for name in names]
+    params.append(("marine_only", "true"))
+    response = SESSION.get(WORMS_BULK_URL, params=params, timeout=60)
+    if response.status_code == 204:
+        return [[] for _ in names]
+    if response.status_code != 200:
+        return None
+    matches = response.json()
+    if len(matches) != len(names):
+        return None
+    return matches
+
+
 @stamina.retry(on=requests.exceptions.HTTPError, attempts=3)
 def _check_scientific_name(name):
-    url = f"http://www.marinespecies.org/rest/AphiaRecordsByName/{name}?like=true&marine_only=true"
-    return requests.get(url, timeout=60)
+    LIMITER.acquire()
+    # Names can carry spaces and parentheses (subgenera), so quote them.
+    url = WORMS_URL.format(name=quote(name, safe=""))
+    return SESSION.get(url, timeout=60)
+
+
+def check_tables_polars(event_fname, occurrence_fname, emof_fname):
+    """Run the table checks on Polars LazyFrames (opt-in fast backend).
+
+    Set `DWC_BACKEND=polars` to use it. The CSVs are scanned lazily, the
+    bounds/null/depth checks compile to streaming expressions, and the joins
+    run multi-threaded without pandas' materialized intermediates. Returns
+    the merged DataFrame (None when the merge fails) and the messages.
+    """
+    msgs = []
+    frames = {
+        "event": (event_fname, required_event_columns),
+        "occurrence": (occurrence_fname, required_occurrence_columns),
+        "emof": (emof_fname, required_emof_columns),
+    }
+    lfs = {}
+    for frame_name, (fname, cols) in frames.items():
+        lf = pl.scan_csv(fname, ignore_errors=True)
+        names = lf.collect_schema().names()
+        renames = {}
+        for name in names:
+            cleaned = _SPECIAL_CHARS.sub("", name.strip()).strip("_")
+            if cleaned != name:
+                renames[name] = cleaned
+        if renames:
+            lf = lf.rename(renames)
+        missing = pd.Index(cols).difference(lf.collect_schema().names()).tolist()
+        if missing:
+            msgs.append(
+                f"{frame_name}: ❌ Failed! Missing required DwC {missing} columns."
+            )
+        else:
+            msgs.append(f"{frame_name}: ✅ Passed required columns!")
+        lfs[frame_name] = lf
 
+    try:
+        n, nunique = (
+            lfs["event"].select(pl.len(), pl.col("eventID").n_unique()).collect().row(0)
+        )
+        if n != nunique:
+            msgs.append(
+                "❌ Merge tables failed. \n`eventID` is not unique in the event table."
+            )
+            return None, msgs
+        n, nunique = (
+            lfs["occurrence"]
+            .select(pl.len(), pl.col("occurrenceID").n_unique())
+            .collect()
+            .row(0)
+        )
+        if n != nunique:
+            msgs.append(
+                "❌ Merge tables failed. \n`occurrenceID` is not unique in the occurrence table."
+            )
+            return None, msgs
+        df = (
+            lfs["event"]
+            .join(lfs["occurrence"], on="eventID", how="inner")
+            .join(lfs["emof"], on="occurrenceID", how="inner")
+            .collect(engine="streaming")
+        )
+    except pl.exceptions.PolarsError as err:
+        msgs.append(f"❌ Merge tables failed. \n{err}")
+        return None, msgs
+    if df.is_empty():
+        msgs.append(
+            "❌ Merge tables failed.\nNo matching `eventID`/`occurrenceID` keys."
+        )
+        return None, msgs
+    msgs.append("✅ Merge tables passed!")
 
-if __name__ == "__main__":
+    null_cols = sorted(
+        name for name, count in df.null_count().row(0, named=True).items() if count
+    )
+    if null_cols:
+        msgs.append(f"⚠️  Columns {null_cols} have missing values.")
+    else:
+        msgs.append("✅ Passed null values check!")
+
+    for col, lo, hi in (("decimalLatitude", -90, 90), ("decimalLongitude", -180, 180)):
+        if col not in df.columns:
+            msgs.append(f"⚠️  Cannot find `{col}` column.")
+            continue
+        # fill_nan folds float NaNs into nulls so one predicate covers both.
+        values = pl.col(col).cast(pl.Float64, strict=False).fill_nan(None)
+        bad = (
+            df.select(pl.arg_where(values.is_null() | (values <= lo) | (values >= hi)))
+            .to_series()
+            .to_numpy()
+        )
+        if bad.size:
+            msgs.append(f"❌ Invalid `{col}` values detected. {_runs(bad)}")
+        else:
+            msgs.append(f"✅ Passed `{col}` bounds!")
+
+    depth_cols = {"minimumDepthInMeters", "maximumDepthInMeters"}
+    if not depth_cols.issubset(df.columns):
+        msgs.append(
+            "⚠️  No depth information found (minimumDepthInMeters/maximumDepthInMeters)."
+        )
+    else:
+        min_depth = (
+            pl.col("minimumDepthInMeters").cast(pl.Float64, strict=False).fill_nan(None)
+        )
+        max_depth = (
+            pl.col("maximumDepthInMeters").cast(pl.Float64, strict=False).fill_nan(None)
+        )
+        bad_nan = (
+            df.select(pl.arg_where(min_depth.is_null() | max_depth.is_null()))
+            .to_series()
+            .to_numpy()
+        )
+        illogical = (
+            df.select(pl.arg_where(min_depth > max_depth)).to_series().to_numpy()
+        )
+        parts = []
+        if bad_nan.size:
+            parts.append(f"⚠️  Non-numeric or missing depth values {_runs(bad_nan)}")
+        if illogical.size:
+            parts.append(
+                f"❌ minimumDepthInMeters is greater than maximumDepthInMeters {_runs(illogical)}"
+            )
+        msgs.append("\n".join(parts) if parts else "✅ Passed depth consistency test!")
+    return df, msgs
+
+
+def main(test_dir=Path("tests/data/good_data")):
+    """Run every check against one set of event/occurrence/emof CSVs."""
     # TODO: Web version add 3 boxes for each upload.
     # test_dir = Path("tests/data/bad_data")
-    test_dir = Path("tests/data/good_data")
     # test_dir = Path("tests/data/encoding_issues")
 
+    if pl is not None and os.environ.get("DWC_BACKEND") == "polars":
+        df, msgs = check_tables_polars(
+            test_dir.joinpath("event_bd.csv"),
+            test_dir.joinpath("occurrence_bd.csv"),
+            test_dir.joinpath("emof_bd.csv"),
+        )
+        [print(msg) for msg in msgs]
+        if df is not None and "scientificName" in df.columns:
+            names = df["scientificName"].drop_nulls().unique().to_list()
+            [print(msg) for res, msg in _resolve_names(names) if not res]
+        return
+
     kw = {"encoding_errors": "ignore"}
-    clean_names = {
-        "axis": "columns",
-        "strip_underscores": True,
-        "case_type": "preserve",
-        "remove_special": True,
-    }
 
-    df_event = pd.read_csv(test_dir.joinpath("event_bd.csv"), **kw).clean_names(
-        **clean_names
+    df_event = read_dwc_csv(
+        test_dir.joinpath("event_bd.csv"), required_event_columns, **kw
+    )
+    df_occurrence = read_dwc_csv(
+        test_dir.joinpath("occurrence_bd.csv"), required_occurrence_columns, **kw
     )
-    df_occurrence = pd.read_csv(
-        test_dir.joinpath("occurrence_bd.csv"), **kw
-    ).clean_names(**clean_names)
-    df_emof = pd.read_csv(test_dir.joinpath("emof_bd.csv"), **kw).clean_names(
-        **clean_names
+    df_emof = read_dwc_csv(
+        test_dir.joinpath("emof_bd.csv"), required_emof_columns, **kw
     )
+    for df_ in (df_event, df_occurrence, df_emof):
+        df_.columns = clean_column_names(df_.columns)
+
+    frames = {
+        "event": (df_event, required_event_columns),
+        "occurrence": (df_occurrence, required_occurrence_columns),
+        "emof": (df_emof, required_emof_columns),
+    }
+    # Check each file against its own required columns; the merged frame
+    # would only tell us that *something* is missing, not where.
+    for frame_name, (df_, cols) in frames.items():
+        res, msg = check_required_columns(df_, columns=cols)
+        print(f"{frame_name}: {msg}")
 
     df, msg = check_merge_tables(
         df_event=df_event, df_occurrence=df_occurrence, df_emof=df_emof
@@ -249,9 +795,6 @@ if __name__ == "__main__":
     print(msg)
 
     if df is not None:
-        res, msg = check_required_columns(df, columns=required_columns)
-        print(msg)
-
         res, msg = check_null_values(df, columns=required_columns)
         print(msg)
 
@@ -264,5 +807,12 @@ if __name__ == "__main__":
         res, msg = check_depth_consistency(df)
         print(msg)
 
+        # Only the occurrence file carries scientificName, so run the WoRMS
+        # check once on the merged frame; the names are deduped before any
+        # request goes out.
         results = check_scientific_names(df)
         [print(msg) for msg in results]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Tiny sqlite-backed cache for WoRMS API responses.
+
+Responses are keyed by the SHA256 of the scientific name and expire after
+`TTL` seconds so WoRMS updates eventually propagate. Set `CACHE_POLICY=replay`
+to forbid network calls and raise `CacheMiss` for any name that is not
+already cached (useful for offline re-runs).
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+# 30 days, long enough for repeated QC runs, short enough for WoRMS updates.
+TTL = 30 * 24 * 60 * 60
+
+CACHE_DIR = Path(
+    os.environ.get("DWC_CACHE_DIR", Path.home().joinpath(".cache", "dwc_worms"))
+)
+
+
+class CacheMiss(LookupError):
+    """Raised on a cache miss when `CACHE_POLICY=replay` is set."""
+
+
+class WormsCache:
+    def __init__(self, directory=CACHE_DIR, ttl=TTL):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._con = sqlite3.connect(
+            directory.joinpath("worms.sqlite"), check_same_thread=False
+        )
+        self._con.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, status INTEGER, payload BLOB, ts REAL)"
+        )
+        self._con.commit()
+
+    @staticmethod
+    def _key(name):
+        return hashlib.sha256(name.encode()).hexdigest()
+
+    def get(self, name):
+        """Return a cached `(status, payload)` tuple or None when missing."""
+        with self._lock:
+            row = self._con.execute(
+                "SELECT status, payload, ts FROM responses WHERE key = ?",
+                (self._key(name),),
+            ).fetchone()
+        if row is not None and time.time() - row[2] <= self.ttl:
+            return row[0], row[1]
+        if os.environ.get("CACHE_POLICY") == "replay":
+            raise CacheMiss(f"No cached WoRMS response for {name!r}.")
+        return None
+
+    def set(self, name, status, payload):
+        with self._lock:
+            self._con.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (self._key(name), status, payload, time.time()),
+            )
+            self._con.commit()